@@ -1,40 +1,53 @@
 import asyncio
-import os
-import pandas as pd
-from src.connector.exchange_base import ExchangeConnector
+from src.connector.exchange_base import get_connector
+from src.learner.utils import configure_logging, install_uvloop
 from src.strategy.scalping_strategy import ScalpingStrategy
 
+async def analyze_symbol(connector, symbol, ticker):
+    """종목별 캔들 조회 및 지표 계산 결과를 출력용 문자열 리스트로 반환."""
+    try:
+        ohlcv, ohlcv_15m = await asyncio.gather(
+            connector.fetch_ohlcv(symbol, timeframe='1m', limit=50),
+            connector.fetch_ohlcv(symbol, timeframe='15m', limit=50),
+        )
+
+        if len(ohlcv) == 0 or len(ohlcv_15m) == 0 or not ticker:
+            return [f"[{symbol}] Data Load Failed"]
+
+        # 종목마다 독립된 전략 인스턴스 사용 (동시 실행 시 상태 공유 방지)
+        strategy = ScalpingStrategy()
+        await strategy.update_indicators(ohlcv, ohlcv_15m)
+        is_buy = await strategy.check_signal(ticker)
+
+        return [
+            f"[{symbol}] Price: {ticker['last']}",
+            f" - RSI: {strategy.rsi:.2f}",
+            f" - Vol Ratio: {strategy.volume_ratio:.2f}",
+            f" - Trend (MA5 > MA20): {strategy.ma_5 > strategy.ma_20}",
+            f" - Signal: {'BUY' if is_buy else 'WAIT'}",
+        ]
+    except Exception as e:
+        return [f"[{symbol}] Error: {e}"]
+
 async def test_current_market():
-    connector = ExchangeConnector()
-    strategy = ScalpingStrategy()
+    connector = get_connector()
     
     test_symbols = ["BTC/KRW", "ETH/KRW", "SOL/KRW"]
     
     print("--- Market Data & Indicator Test ---")
-    
-    for symbol in test_symbols:
-        try:
-            ohlcv = await connector.fetch_ohlcv(symbol, timeframe='1m', limit=50)
-            ticker = await connector.fetch_ticker(symbol)
-            
-            if not ohlcv or not ticker:
-                print(f"[{symbol}] Data Load Failed")
-                continue
-                
-            await strategy.update_indicators(ohlcv)
-            
-            print(f"[{symbol}] Price: {ticker['last']}")
-            print(f" - RSI: {strategy.rsi:.2f}")
-            print(f" - Vol Ratio: {strategy.volume_ratio:.2f}")
-            print(f" - Trend (MA5 > MA20): {strategy.ma_5 > strategy.ma_20}")
-            
-            is_buy = await strategy.check_signal(ticker)
-            print(f" - Signal: {'BUY' if is_buy else 'WAIT'}")
-                
-        except Exception as e:
-            print(f"[{symbol}] Error: {e}")
 
+    # 시세는 한 번에 일괄 조회, 캔들은 종목별로 동시에 조회
+    tickers = await connector.fetch_tickers(test_symbols)
+    results = await asyncio.gather(
+        *(analyze_symbol(connector, symbol, tickers.get(symbol)) for symbol in test_symbols)
+    )
+    for lines in results:
+        print("\n".join(lines))
+
+    await connector.close()
     print("--- Test End ---")
 
 if __name__ == "__main__":
+    configure_logging()
+    install_uvloop()
     asyncio.run(test_current_market())
@@ -6,37 +6,53 @@ import sys
 sys.stdout.reconfigure(encoding='utf-8')
 
 from dotenv import load_dotenv
-from src.connector.exchange_base import ExchangeConnector
+from src.connector.exchange_base import get_connector
+from src.learner.utils import configure_logging, install_uvloop
 
 load_dotenv()
 
+WATCH_UPDATES = 5  # 출력할 실시간 시세 업데이트 횟수
+
+
+def emit(*lines: str):
+    """여러 줄을 한 번의 write로 기록."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 async def main():
-    print("----------------------------------------")
-    print(" [UPBIT 연결 테스트]")
-    print("----------------------------------------")
+    emit(
+        "----------------------------------------",
+        " [UPBIT 연결 테스트]",
+        "----------------------------------------",
+    )
 
     os.environ["EXCHANGE_ID"] = "upbit"
     
     try:
-        connector = ExchangeConnector()
-        print(f"✅ 커넥터: {connector.exchange_id}")
+        connector = get_connector()
+        emit(f"✅ 커넥터: {connector.exchange_id}")
         
         balance = await connector.fetch_balance()
         if balance:
             # 테스트 모드라면 100만원이 보여야 함
             krw = balance.get('total', {}).get('KRW', 0)
-            print(f"💰 원화 잔고: {krw:,.0f}원")
+            emit(f"💰 원화 잔고: {krw:,.0f}원")
         else:
-            print("❌ 잔고 조회 실패")
+            emit("❌ 잔고 조회 실패")
             
-        ticker = await connector.fetch_ticker("BTC/KRW")
-        if ticker:
-            print(f"📈 비트코인: {ticker['last']:,.0f}원")
+        # 웹소켓 구독 하나로 연속 시세 수신 (매번 REST 요청하지 않음)
+        for _ in range(WATCH_UPDATES):
+            ticker = await connector.watch_ticker("BTC/KRW")
+            if not ticker:
+                break
+            emit(f"📈 비트코인: {ticker['last']:,.0f}원")
             
         await connector.close()
         
     except Exception as e:
-        print(f"🚨 에러: {e}")
+        emit(f"🚨 에러: {e}")
 
 if __name__ == "__main__":
+    configure_logging()
+    install_uvloop()
     asyncio.run(main())
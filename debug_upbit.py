@@ -1,13 +1,14 @@
 import asyncio
 import os
 from dotenv import load_dotenv
-from src.connector.exchange_base import ExchangeConnector
+from src.connector.exchange_base import get_connector
+from src.learner.utils import configure_logging, install_uvloop
 
 load_dotenv()
 
 async def debug_connection():
     print("--- Start Connection Test ---")
-    connector = ExchangeConnector()
+    connector = get_connector()
     try:
         # 1. Balance Test
         print("1. Checking Balance...")
@@ -30,4 +31,6 @@ async def debug_connection():
         await connector.close()
 
 if __name__ == "__main__":
+    configure_logging()
+    install_uvloop()
     asyncio.run(debug_connection())
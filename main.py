@@ -7,7 +7,7 @@ import os
 import signal
 from dotenv import load_dotenv
 from src.strategy_manager import StrategyManager
-from src.learner.utils import get_logger
+from src.learner.utils import get_logger, configure_logging, install_uvloop
 
 # 환경 변수 로드 (.env 파일이 있으면 읽어옴)
 load_dotenv()
@@ -44,13 +44,17 @@ async def main():
     except KeyboardInterrupt:
         logger.info("사용자에 의해 프로그램이 중단되었습니다.")
     except Exception as e:
-        logger.error(f"시스템 실행 중 치명적 에러 발생: {e}")
+        logger.error("시스템 실행 중 치명적 에러 발생: %s", e)
     finally:
         manager.stop()
+        await manager.connector.close()
+        await manager.notifier.close()
         logger.info("시스템이 완전히 종료되었습니다.")
 
 
 if __name__ == "__main__":
+    configure_logging()
+    install_uvloop()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
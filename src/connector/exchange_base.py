@@ -2,109 +2,302 @@
 거래소 API 연결을 담당하는 통합 모듈.
 업비트(Upbit) 및 HTX(Huobi) 거래소를 지원합니다.
 """
+import asyncio
+import inspect
 import os
+import ssl
+import time
+from functools import lru_cache, wraps
+import aiohttp
 import ccxt.async_support as ccxt
-from typing import Dict, Any, Optional, List
-from src.learner.utils import get_logger
+import ccxt.pro as ccxtpro
+import numpy as np
+from typing import Dict, Any, Optional, List, Tuple, Callable, Awaitable
+from src.learner.utils import get_logger, env_flag
 
 logger = get_logger(__name__)
 
+# HTTP 커넥션 풀 설정 (keep-alive 유지로 매 요청 TCP/TLS 핸드셰이크 방지)
+HTTP_POOL_LIMIT = 20           # 전체 동시 연결 수
+HTTP_KEEPALIVE_SECONDS = 60    # 유휴 연결 유지 시간 (aiohttp 기본 15초)
+DNS_CACHE_SECONDS = 300        # DNS 캐시 유지 시간 (aiohttp 기본 10초)
+
+# 거래소별 특화 설정 (등록되지 않은 거래소는 기본값 사용)
+# - options: ccxt 생성 시 추가할 옵션
+# - market_buy_by_cost: 시장가 매수를 수량이 아닌 '총 금액'으로 주문하는지 여부
+# - quote_currency: 잔고/주문 기준 통화
+_DEFAULT_PROFILE: Dict[str, Any] = {'options': {}, 'market_buy_by_cost': False, 'quote_currency': 'USDT'}
+_EXCHANGE_PROFILES: Dict[str, Dict[str, Any]] = {
+    'upbit': {
+        'options': {'createMarketBuyOrderRequiresPrice': False},
+        'market_buy_by_cost': True,
+        'quote_currency': 'KRW',
+    },
+}
+
+# OHLCV 배열 열 순서: [timestamp(ms), open, high, low, close, volume]
+OHLCV_COLUMNS = 6
+
+# 조회 결과 캐시 유지 시간 (같은 루프 안의 중복 요청 제거)
+TICKER_CACHE_SECONDS = 0.5
+OHLCV_CACHE_SECONDS = 1.0
+
+# 종료 시 클라이언트별 close() 대기 한도 (멈춘 연결이 종료를 막지 않도록)
+CLOSE_TIMEOUT_SECONDS = 2.0
+
+
+@lru_cache(maxsize=None)
+def _get_exchange_class(exchange_id: str) -> Any:
+    """거래소 ID로 ccxt 클래스를 찾아 캐싱 (exchanges 리스트 선형 탐색 1회)."""
+    if exchange_id not in ccxt.exchanges:
+        raise ValueError(f"지원하지 않는 거래소입니다: {exchange_id}")
+    return getattr(ccxt, exchange_id)
+
+
+def _fallback_on_error(message: str, default: Callable[[], Any]):
+    """거래소 호출 예외를 로깅하고 기본값을 반환하는 데코레이터.
+
+    message는 메서드 인자 이름으로 포맷됩니다. (예: "시세 조회 에러 ({symbol})")
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                arguments = signature.bind(*args, **kwargs).arguments
+                logger.error("%s: %s", message.format(**arguments), e)
+                return default()
+        return wrapper
+    return decorator
+
+
+def _ssl_setting(exchange: Any) -> Any:
+    """ccxt open()과 같은 규칙으로 세션 SSL 설정을 결정 (verify/include_OS_certificates 반영).
+
+    검증을 끄면 False, 아니면 ccxt 인스턴스의 ssl_context를 생성/재사용합니다.
+    """
+    if exchange.ssl_context is None:
+        exchange.ssl_context = ssl.create_default_context(cafile=exchange.cafile) if exchange.verify else False
+        if exchange.ssl_context and exchange.safe_bool(exchange.options, 'include_OS_certificates', False):
+            os_default_paths = ssl.get_default_verify_paths()
+            if os_default_paths.cafile and os_default_paths.cafile != exchange.cafile:
+                exchange.ssl_context.load_verify_locations(cafile=os_default_paths.cafile)
+    return exchange.ssl_context
+
 
 class ExchangeConnector:
     """거래소와의 직접적인 통신을 담당하는 클래스."""
 
     def __init__(self, exchange_id: str = None):
         """환경 변수에 따라 거래소를 선택하여 초기화."""
-        self.exchange_id = exchange_id or os.getenv("EXCHANGE_ID", "upbit").lower()
-        self.api_key = os.getenv("API_KEY")
-        self.secret_key = os.getenv("SECRET_KEY")
-        self.is_dry_run = os.getenv("DRY_RUN", "True").lower() == "true"
-        
+        env = os.environ
+        self.exchange_id = (exchange_id or env.get("EXCHANGE_ID", "upbit")).lower()
+        self.api_key = env.get("API_KEY")
+        self.secret_key = env.get("SECRET_KEY")
+        self.is_dry_run = env_flag("DRY_RUN", True)
+        self.profile = _EXCHANGE_PROFILES.get(self.exchange_id, _DEFAULT_PROFILE)
+        self.quote_currency: str = self.profile['quote_currency']
+
+        # 시세/캔들 조회 캐시: key -> (만료 시각, 결과), 진행 중인 요청: key -> Task
+        self._cache: Dict[Tuple, Tuple[float, Any]] = {}
+        self._inflight: Dict[Tuple, asyncio.Task] = {}
+        # 웹소켓 시세 구독용 ccxt.pro 클라이언트 (watch_ticker 최초 호출 시 생성)
+        self._stream: Any = None
+
         self.exchange = self._init_exchange()
-        logger.info(f"🔌 {self.exchange_id.upper()} 연결 완료 (테스트모드: {self.is_dry_run})")
+        if self.is_dry_run:
+            # 테스트모드는 호출마다 분기하지 않도록 생성 시 모의 구현으로 교체
+            self.fetch_balance = self._dry_run_fetch_balance
+            self.create_order = self._dry_run_create_order
+        logger.info("🔌 %s 연결 완료 (테스트모드: %s)", self.exchange_id.upper(), self.is_dry_run)
 
     def _init_exchange(self) -> Any:
         """거래소 객체 생성 및 설정."""
-        if self.exchange_id not in ccxt.exchanges:
-            raise ValueError(f"지원하지 않는 거래소입니다: {self.exchange_id}")
-            
-        exchange_class = getattr(ccxt, self.exchange_id)
-        
-        options = {
+        exchange_class = _get_exchange_class(self.exchange_id)
+        return exchange_class(self._client_config())
+
+    def _client_config(self) -> Dict[str, Any]:
+        """REST/웹소켓 클라이언트 공통 ccxt 설정."""
+        return {
             'apiKey': self.api_key,
             'secret': self.secret_key,
             'enableRateLimit': True,
             'options': {
                 'defaultType': 'spot',
+                **self.profile['options'],
             }
         }
 
-        if self.exchange_id == 'upbit':
-            options['options']['createMarketBuyOrderRequiresPrice'] = False
-            
-        return exchange_class(options)
+    def _ensure_session(self) -> None:
+        """ccxt 기본 세션 대신 keep-alive 튜닝된 세션을 주입 (이벤트 루프 안에서 호출)."""
+        exchange = self.exchange
+        if exchange.session is not None:
+            return
+        connector = aiohttp.TCPConnector(
+            ssl=_ssl_setting(exchange),
+            limit=HTTP_POOL_LIMIT,
+            keepalive_timeout=HTTP_KEEPALIVE_SECONDS,
+            ttl_dns_cache=DNS_CACHE_SECONDS,
+            enable_cleanup_closed=True,
+        )
+        # ccxt가 close() 시 세션과 커넥터를 함께 정리하도록 속성에 연결
+        exchange.tcp_connector = connector
+        exchange.session = aiohttp.ClientSession(connector=connector, trust_env=exchange.aiohttp_trust_env)
 
-    async def fetch_ticker(self, symbol: str) -> Dict[str, Any]:
-        """현재가 및 시세 정보 조회."""
+    async def load_markets(self) -> bool:
+        """마켓 정보를 기동 시 1회 미리 로드 (이후 요청은 캐시된 마켓 재사용)."""
+        if self.exchange.markets:
+            return True
+        self._ensure_session()
         try:
-            return await self.exchange.fetch_ticker(symbol)
+            await self.exchange.load_markets()
+            logger.info("📚 마켓 정보 로드 완료 (%d개)", len(self.exchange.markets))
+            return True
         except Exception as e:
-            logger.error(f"시세 조회 에러 ({symbol}): {e}")
-            return {}
+            logger.error("마켓 정보 로드 에러: %s", e)
+            return False
 
-    async def fetch_ohlcv(self, symbol: str, timeframe: str = '1d', limit: int = 2) -> List[List[Any]]:
-        """과거 캔들 데이터 조회."""
-        try:
-            return await self.exchange.fetch_ohlcv(symbol, timeframe=timeframe, limit=limit)
-        except Exception as e:
-            logger.error(f"데이터 조회 에러 ({symbol}): {e}")
-            return []
+    async def _coalesce(self, key: Tuple, ttl: float, fetch: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+        """TTL 캐시 조회 후, 같은 키로 진행 중인 요청이 있으면 그 결과를 함께 기다림."""
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch(*args))
+            self._inflight[key] = task
+
+            def _store(done: asyncio.Task) -> None:
+                self._inflight.pop(key, None)
+                if not done.cancelled() and done.exception() is None and len(done.result()) > 0:
+                    self._cache[key] = (time.monotonic() + ttl, done.result())
+
+            task.add_done_callback(_store)
 
+        # 대기 중인 호출자 하나가 취소되어도 공유 요청은 계속 진행
+        return await asyncio.shield(task)
+
+    async def fetch_ticker(self, symbol: str) -> Dict[str, Any]:
+        """현재가 및 시세 정보 조회 (짧은 TTL 캐시 및 중복 요청 병합)."""
+        return await self._coalesce(("ticker", symbol), TICKER_CACHE_SECONDS, self._fetch_ticker, symbol)
+
+    @_fallback_on_error("시세 조회 에러 ({symbol})", dict)
+    async def _fetch_ticker(self, symbol: str) -> Dict[str, Any]:
+        self._ensure_session()
+        return await self.exchange.fetch_ticker(symbol)
+
+    @_fallback_on_error("시세 구독 에러 ({symbol})", dict)
+    async def watch_ticker(self, symbol: str) -> Dict[str, Any]:
+        """웹소켓 구독으로 다음 시세 업데이트를 수신 (미지원 거래소는 REST 조회로 대체)."""
+        if self._stream is None:
+            if self.exchange_id not in ccxtpro.exchanges:
+                return await self.fetch_ticker(symbol)
+            self._stream = getattr(ccxtpro, self.exchange_id)(self._client_config())
+        return await self._stream.watch_ticker(symbol)
+
+    @_fallback_on_error("시세 일괄 조회 에러 ({symbols})", dict)
+    async def fetch_tickers(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """여러 종목의 시세를 한 번의 요청으로 조회."""
+        self._ensure_session()
+        return await self.exchange.fetch_tickers(symbols)
+
+    async def fetch_ohlcv(self, symbol: str, timeframe: str = '1d', limit: int = 2) -> np.ndarray:
+        """과거 캔들 데이터 조회 (짧은 TTL 캐시 및 중복 요청 병합).
+
+        (캔들 수, 6) 크기의 float64 배열을 반환하며, 캐시를 여러 호출자가 공유하므로 읽기 전용입니다.
+        """
+        return await self._coalesce(("ohlcv", symbol, timeframe, limit), OHLCV_CACHE_SECONDS,
+                                    self._fetch_ohlcv, symbol, timeframe, limit)
+
+    @_fallback_on_error("데이터 조회 에러 ({symbol})", lambda: np.empty((0, OHLCV_COLUMNS)))
+    async def _fetch_ohlcv(self, symbol: str, timeframe: str, limit: int) -> np.ndarray:
+        self._ensure_session()
+        rows = await self.exchange.fetch_ohlcv(symbol, timeframe=timeframe, limit=limit)
+        # 행 리스트를 한 번에 연속 메모리 배열로 복사 (지표 계산에서 바로 벡터 연산)
+        ohlcv = np.empty((len(rows), OHLCV_COLUMNS), dtype=np.float64)
+        if rows:
+            ohlcv[:] = rows
+        ohlcv.flags.writeable = False
+        return ohlcv
+
+    @_fallback_on_error("잔고 조회 에러", dict)
     async def fetch_balance(self) -> Dict[str, Any]:
         """계좌 잔고 조회."""
-        if self.is_dry_run:
-            currency = "KRW" if self.exchange_id == 'upbit' else "USDT"
-            return {"free": {currency: 1000000.0}, "total": {currency: 1000000.0}}
-            
-        try:
-            # 시장 데이터(마켓 정보)가 로드되어야 잔고 계산이 정확함
-            if not self.exchange.markets:
-                await self.exchange.load_markets()
-            return await self.exchange.fetch_balance()
-        except Exception as e:
-            logger.error(f"잔고 조회 에러: {e}")
-            return {}
+        self._ensure_session()
+        # 시장 데이터(마켓 정보)가 로드되어야 잔고 계산이 정확함 (기동 시 실패한 경우 재시도)
+        if not self.exchange.markets:
+            await self.exchange.load_markets()
+        return await self.exchange.fetch_balance()
 
+    @_fallback_on_error("주문 실행 에러 ({symbol} {side})", dict)
     async def create_order(self, symbol: str, side: str, amount: float, price: Optional[float] = None) -> Dict[str, Any]:
         """주문 실행 (업비트 특화 로직 포함)."""
-        if self.is_dry_run:
-            logger.info(f"[시뮬레이션] {symbol} {side} {amount:,.2f}")
-            return {"id": "dry_run", "status": "closed"}
+        self._ensure_session()
+        # 마켓 정보 로드 (정밀도 계산용, 기동 시 실패한 경우 재시도)
+        if not self.exchange.markets:
+            await self.exchange.load_markets()
 
-        try:
-            # 마켓 정보 로드 (정밀도 계산용)
-            if not self.exchange.markets:
-                await self.exchange.load_markets()
-
-            if side == 'buy':
-                if self.exchange_id == 'upbit':
-                    # 업비트 시장가 매수는 '총 금액'을 입력해야 함
-                    # amount 인자가 KRW 금액으로 들어온다고 가정
-                    return await self.exchange.create_order(symbol, 'market', 'buy', amount)
-                else:
-                    return await self.exchange.create_market_buy_order(symbol, amount)
+        if side == 'buy':
+            if self.profile['market_buy_by_cost']:
+                # 업비트 시장가 매수는 '총 금액'을 입력해야 함
+                # amount 인자가 KRW 금액으로 들어온다고 가정
+                return await self.exchange.create_order(symbol, 'market', 'buy', amount)
             else:
-                # 매도는 '수량' 기준 (정밀도 조절 필수)
-                amount = self.exchange.amount_to_precision(symbol, amount)
-                return await self.exchange.create_market_sell_order(symbol, amount)
-                
-        except Exception as e:
-            logger.error(f"주문 실행 에러 ({symbol} {side}): {e}")
-            return {}
+                return await self.exchange.create_market_buy_order(symbol, amount)
+        else:
+            # 매도는 '수량' 기준 (정밀도 조절 필수)
+            amount = self.exchange.amount_to_precision(symbol, amount)
+            return await self.exchange.create_market_sell_order(symbol, amount)
+
+    async def _dry_run_fetch_balance(self) -> Dict[str, Any]:
+        """테스트모드 가상 잔고."""
+        currency = self.quote_currency
+        return {"free": {currency: 1000000.0}, "total": {currency: 1000000.0}}
+
+    async def _dry_run_create_order(self, symbol: str, side: str, amount: float, price: Optional[float] = None) -> Dict[str, Any]:
+        """테스트모드 가상 주문 (실제 주문 없음)."""
+        logger.debug("[시뮬레이션] %s %s %.2f", symbol, side, amount)
+        return {"id": "dry_run", "status": "closed"}
 
     async def close(self):
         """연결 종료 및 리소스 해제."""
-        try:
-            await self.exchange.close()
-        except:
-            pass
+        if _connectors.get(self.exchange_id) is self:
+            del _connectors[self.exchange_id]
+
+        # 세션을 닫기 전에 진행 중인 공유 조회 요청부터 취소
+        for task in self._inflight.values():
+            task.cancel()
+        self._inflight.clear()
+        self._cache.clear()
+
+        clients = [client for client in (self._stream, self.exchange) if client is not None]
+        self._stream = None
+        # 클라이언트마다 제한 시간 안에 동시에 종료 (하나가 멈추거나 실패해도 나머지는 계속 정리)
+        results = await asyncio.gather(
+            *(asyncio.wait_for(client.close(), timeout=CLOSE_TIMEOUT_SECONDS) for client in clients),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, asyncio.TimeoutError):
+                logger.warning("%s 연결 종료 시간 초과 (%.0f초)", self.exchange_id.upper(), CLOSE_TIMEOUT_SECONDS)
+            elif isinstance(result, (ccxt.BaseError, aiohttp.ClientError, OSError)):
+                logger.warning("%s 연결 종료 중 에러: %s", self.exchange_id.upper(), result)
+            elif isinstance(result, BaseException):
+                raise result
+
+
+# 프로세스 전역에서 공유하는 거래소별 커넥터 (ccxt 클라이언트/세션 재사용)
+_connectors: Dict[str, ExchangeConnector] = {}
+
+
+def get_connector(exchange_id: str = None) -> ExchangeConnector:
+    """거래소별 공유 커넥터 반환 (없으면 생성)."""
+    key = (exchange_id or os.environ.get("EXCHANGE_ID", "upbit")).lower()
+    connector = _connectors.get(key)
+    if connector is None:
+        connector = _connectors[key] = ExchangeConnector(key)
+    return connector
@@ -7,7 +7,7 @@ import os
 from typing import List, Optional
 from datetime import datetime
 from .schema import FeatureSet, TradeEvent
-from .utils import get_logger, now_utc
+from .utils import get_logger, now_utc, env_flag
 
 logger = get_logger(__name__)
 
@@ -20,15 +20,15 @@ class FeatureStore:
         self.db_url = os.getenv("FEATURE_STORE_DB_URL", "postgresql://localhost:5432/coin_db")
         self.redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
         # 테스트/DRY_RUN 환경에서는 Mock 객체 사용 가능
-        self._is_dry_run = os.getenv("DRY_RUN", "True").lower() == "true"
+        self._is_dry_run = env_flag("DRY_RUN", True)
 
     async def save_features(self, features: FeatureSet) -> bool:
         """피처 세트를 저장소에 저장 (비동기)."""
         if self._is_dry_run:
-            logger.info(f"[DRY_RUN] Saving features: {features.event_id}")
+            logger.info("[DRY_RUN] Saving features: %s", features.event_id)
             return True
         
-        logger.info(f"Saved features to DB: {features.event_id}")
+        logger.info("Saved features to DB: %s", features.event_id)
         return True
 
     async def get_features(self, event_id: str) -> Optional[FeatureSet]:
@@ -37,7 +37,7 @@ class FeatureStore:
 
     async def compute_features(self, event: TradeEvent) -> FeatureSet:
         """실시간 이벤트로부터 피처 계산 및 생성."""
-        logger.debug(f"Computing features for event: {event.trace_id}")
+        logger.debug("Computing features for event: %s", event.trace_id)
         
         # timestamp가 None인 경우를 대비한 방어적 로직 추가
         safe_timestamp = event.timestamp if event.timestamp else now_utc()
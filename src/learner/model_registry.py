@@ -6,7 +6,7 @@ import os
 import pickle
 import json
 from typing import Any, Dict, Optional
-from .utils import get_logger
+from .utils import get_logger, env_flag
 
 logger = get_logger(__name__)
 
@@ -18,11 +18,11 @@ class ModelRegistry:
         self.registry_path = registry_path
         os.makedirs(registry_path, exist_ok=True)
         self.metadata_file = os.path.join(registry_path, "metadata.json")
-        self._is_dry_run = os.getenv("DRY_RUN", "True").lower() == "true"
+        self._is_dry_run = env_flag("DRY_RUN", True)
 
     def load_model(self, version: str = "latest") -> Any:
         """지정된 버전(또는 최신)의 모델 로드."""
-        logger.info(f"Loading model version: {version}")
+        logger.info("Loading model version: %s", version)
         # 실제 구현: 피클 파일 로드 또는 ONNX 런타임 초기화
         # 여기서는 Mock 모델 객체 반환
         return MockModel(version=version)
@@ -30,7 +30,7 @@ class ModelRegistry:
     def save_model(self, model: Any, metadata: Dict[str, Any]) -> str:
         """모델 및 메타데이터 저장."""
         if self._is_dry_run:
-            logger.info(f"[DRY_RUN] Saving model with metadata: {metadata}")
+            logger.info("[DRY_RUN] Saving model with metadata: %s", metadata)
             return "v_dry_run"
 
         version = f"v_{int(datetime.now().timestamp())}"
@@ -42,7 +42,7 @@ class ModelRegistry:
             
         # 메타데이터 업데이트
         self._update_metadata(version, metadata)
-        logger.info(f"Model saved: {version}")
+        logger.info("Model saved: %s", version)
         return version
 
     def _update_metadata(self, version: str, meta: Dict[str, Any]):
@@ -3,11 +3,10 @@
 누적 데이터를 사용해 모델을 재학습하고 레지스트리에 등록.
 """
 import asyncio
-import os
 from typing import Dict, Any
 from .feature_store import FeatureStore
 from .model_registry import ModelRegistry
-from .utils import get_logger
+from .utils import get_logger, env_flag
 
 logger = get_logger(__name__)
 
@@ -18,11 +17,11 @@ class OfflineTrainer:
     def __init__(self):
         self.feature_store = FeatureStore()
         self.registry = ModelRegistry()
-        self._is_dry_run = os.getenv("DRY_RUN", "True").lower() == "true"
+        self._is_dry_run = env_flag("DRY_RUN", True)
 
     async def train_batch(self, start_time, end_time) -> Dict[str, Any]:
         """주어진 기간의 데이터로 모델 재학습."""
-        logger.info(f"Starting batch training ({start_time} ~ {end_time})")
+        logger.info("Starting batch training (%s ~ %s)", start_time, end_time)
         
         # 1. 데이터 로드 (Feature Store에서)
         # data = await self.feature_store.load_batch(start_time, end_time)
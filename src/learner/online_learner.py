@@ -3,32 +3,105 @@
 실시간 성과(P&L)를 분석하여 최적의 전략 파라미터를 동적으로 제안.
 """
 import asyncio
-import os
-import random
-from typing import Dict, Any, List, Deque
 from collections import deque
-from .schema import TradeEvent, Prediction, ExecutionResult, TradeParams
+from dataclasses import replace
+from typing import Iterator, Tuple
+import numpy as np
+from .schema import TradeEvent, Prediction, ExecutionResult, ParamSet
 from .feature_store import FeatureStore
 from .model_registry import ModelRegistry
-from .utils import get_logger
+from .utils import get_logger, env_flag
+from src.strategy.indicators import RollingWindow
 
 logger = get_logger(__name__)
 
 
+def performance_stats(profit_sum: float, profit_count: int,
+                      loss_sum: float, loss_count: int) -> Tuple[float, float, float]:
+    """수익/손실 합계와 횟수로 (승률, 기대값, 손익비) 계산.
+
+    윈도우 합계만 받는 순수 스칼라 함수 (호출당 상수 개 연산).
+    """
+    total = profit_count + loss_count
+    win_rate = profit_count / total
+    avg_profit = profit_sum / profit_count if profit_count else 0
+    avg_loss = abs(loss_sum / loss_count) if loss_count else 0.001
+
+    profit_factor = (profit_sum / abs(loss_sum)) if loss_count and loss_sum != 0 else 2.0
+    expected_value = (win_rate * avg_profit) - ((1 - win_rate) * avg_loss)
+    return win_rate, expected_value, profit_factor
+
+
+class PnlWindow:
+    """최근 N회 거래 수익률 윈도우.
+
+    수익/손실을 각각 RollingWindow(float32 저장, float64 합계)에 나눠 담아
+    합계와 횟수를 O(1)로 제공합니다. (0은 손실로 분류)
+    """
+
+    def __init__(self, size: int = 50):
+        self.size = size
+        self._profits = RollingWindow(size, dtype=np.float32)
+        self._losses = RollingWindow(size, dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self._profits)
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self.values().tolist())
+
+    def values(self) -> np.ndarray:
+        """오래된 순으로 정렬된 윈도우 값 (복사본)."""
+        # 같은 위치의 수익/손실 중 하나는 항상 0
+        return self._profits.values() + self._losses.values()
+
+    @property
+    def profit_sum(self) -> float:
+        return self._profits.sum
+
+    @property
+    def profit_count(self) -> int:
+        return self._profits.nonzero_count
+
+    @property
+    def loss_sum(self) -> float:
+        return self._losses.sum
+
+    @property
+    def loss_count(self) -> int:
+        return len(self._profits) - self._profits.nonzero_count
+
+    def append(self, pnl: float):
+        """값을 추가하고, 밀려나는 가장 오래된 값은 합계에서 제외."""
+        if pnl > 0:
+            self._profits.push(pnl)
+            self._losses.push(0.0)
+        else:
+            self._profits.push(0.0)
+            self._losses.push(pnl)
+
+
 class OnlineLearner:
     """자가 학습 및 파라미터 튜닝 엔진."""
 
+    __slots__ = (
+        "update_queue", "_update_event", "_is_dry_run", "recent_pnl", "current_params",
+        "_feature_store", "_registry",
+    )
+
     def __init__(self):
-        self.feature_store = FeatureStore()
-        self.registry = ModelRegistry()
-        self.update_queue = asyncio.Queue()
-        self._is_dry_run = os.getenv("DRY_RUN", "False").lower() == "true"
+        # 소비자가 학습 루프 하나뿐이므로 락 없는 deque + 이벤트로 대기열 구성
+        self.update_queue: deque = deque()
+        self._update_event = asyncio.Event()
+        self._is_dry_run = env_flag("DRY_RUN", False)
+        self._feature_store = None
+        self._registry = None
         
         # [핵심] 최근 50회 거래 성과 메모리 (단기 기억)
-        self.recent_pnl: Deque[float] = deque(maxlen=50)
+        self.recent_pnl = PnlWindow(size=50)
         
         # 현재 적용 중인 기본 파라미터 (초기값) - 거래 빈도를 높이기 위해 조건 완화
-        self.current_params = TradeParams(
+        self.current_params = ParamSet(
             k=0.5, 
             rsi_buy_threshold=40,    # 30에서 40으로 상향 (조금 더 쉽게 진입)
             stop_loss_pct=0.005,
@@ -39,73 +112,99 @@ class OnlineLearner:
         # 백그라운드 학습 루프 시작
         asyncio.create_task(self._training_loop())
 
+    @property
+    def feature_store(self) -> FeatureStore:
+        """피처 저장소 (현재 적응형 로직에서는 사용하지 않으므로 처음 접근할 때 생성)."""
+        if self._feature_store is None:
+            self._feature_store = FeatureStore()
+        return self._feature_store
+
+    @property
+    def registry(self) -> ModelRegistry:
+        """모델 레지스트리 (생성 시 저장 디렉터리를 만들므로 처음 접근할 때 생성)."""
+        if self._registry is None:
+            self._registry = ModelRegistry()
+        return self._registry
+
     async def predict(self, event: TradeEvent) -> Prediction:
         """현재 시장 상황과 과거 성과를 반영한 최적 파라미터 제안."""
         adjusted_params = self._adjust_params_based_on_performance()
         
         return Prediction(
             model_version="adaptive_v1",
-            suggested_params=adjusted_params,
+            suggested_params=adjusted_params.to_model(),
             estimated_slippage=0.001,
             confidence_score=self._calculate_confidence()
         )
 
-    def _adjust_params_based_on_performance(self) -> TradeParams:
-        """최근 성과(승률, 손익비, 기대값)에 따라 전략 파라미터 동적 튜닝."""
+    def _adjust_params_based_on_performance(self) -> ParamSet:
+        """최근 성과(승률, 손익비, 기대값)에 따라 전략 파라미터 동적 튜닝.
+
+        파라미터가 바뀌는 경우에만 새 객체를 만듭니다 (copy-on-change).
+        """
         if not self.recent_pnl:
             return self.current_params
 
-        profits = [p for p in self.recent_pnl if p > 0]
-        losses = [p for p in self.recent_pnl if p <= 0]
-        
-        win_rate = len(profits) / len(self.recent_pnl)
-        avg_profit = sum(profits) / len(profits) if profits else 0
-        avg_loss = abs(sum(losses) / len(losses)) if losses else 0.001
-        
-        profit_factor = (sum(profits) / abs(sum(losses))) if losses and sum(losses) != 0 else 2.0
-        expected_value = (win_rate * avg_profit) - ((1 - win_rate) * avg_loss)
+        window = self.recent_pnl
+        win_rate, expected_value, profit_factor = performance_stats(
+            window.profit_sum, window.profit_count, window.loss_sum, window.loss_count
+        )
         
-        new_params = self.current_params.model_copy()
+        params = self.current_params
 
         # [튜닝 로직 1] 기대값이 음수이거나 손익비가 1.0 미만 (손실 구간)
         if expected_value < 0 or profit_factor < 1.1:
-            logger.debug(f"📉 성과 저조 (EV: {expected_value:.4f}, PF: {profit_factor:.2f}). 보수적 설정 적용.")
-            new_params.k = min(0.85, new_params.k + 0.05)
-            new_params.rsi_buy_threshold = max(20, new_params.rsi_buy_threshold - 2)
-            new_params.volume_multiplier = min(1.8, new_params.volume_multiplier + 0.1)
-            new_params.stop_loss_pct = max(0.005, new_params.stop_loss_pct - 0.001)
+            logger.debug("📉 성과 저조 (EV: %.4f, PF: %.2f). 보수적 설정 적용.", expected_value, profit_factor)
+            return replace(
+                params,
+                k=min(0.85, params.k + 0.05),
+                rsi_buy_threshold=max(20, params.rsi_buy_threshold - 2),
+                volume_multiplier=min(1.8, params.volume_multiplier + 0.1),
+                stop_loss_pct=max(0.005, params.stop_loss_pct - 0.001),
+            )
             
         # [튜닝 로직 2] 성과 우수 (손익비 1.5 이상, 기대값 양수)
         elif profit_factor > 1.5 and expected_value > 0.002:
-            logger.debug(f"📈 성과 우수 (PF: {profit_factor:.2f}). 기회 확대.")
-            new_params.k = max(0.35, new_params.k - 0.03)
-            new_params.rsi_buy_threshold = min(45, new_params.rsi_buy_threshold + 2)
-            new_params.volume_multiplier = max(0.5, new_params.volume_multiplier - 0.1)
+            logger.debug("📈 성과 우수 (PF: %.2f). 기회 확대.", profit_factor)
+            return replace(
+                params,
+                k=max(0.35, params.k - 0.03),
+                rsi_buy_threshold=min(45, params.rsi_buy_threshold + 2),
+                volume_multiplier=max(0.5, params.volume_multiplier - 0.1),
+            )
 
-        return new_params
+        # 조정이 없으면 복사 없이 현재 파라미터를 그대로 반환 (호출 측은 읽기 전용으로 사용)
+        return params
 
     def _calculate_confidence(self) -> float:
-        """현재 모델의 신뢰도 (최근 승률 기반)."""
+        """현재 모델의 신뢰도 (최근 승률 기반, 윈도우의 누적 수익 횟수로 O(1) 계산)."""
         if not self.recent_pnl: return 0.5
-        win_rate = len([p for p in self.recent_pnl if p > 0]) / len(self.recent_pnl)
-        return win_rate
+        return self.recent_pnl.profit_count / len(self.recent_pnl)
 
     async def feedback(self, result: ExecutionResult):
-        """거래 결과 수신 및 학습 큐 추가."""
-        await self.update_queue.put(result)
+        """거래 결과 수신 및 학습 큐 추가 (학습 루프는 수익률만 사용하므로 값만 넣음)."""
+        self.update_queue.append(result.pnl_pct)
+        self._update_event.set()
 
     async def _training_loop(self):
         """백그라운드에서 성과 데이터 학습."""
         logger.info("Adaptive Learning Loop Started.")
         while True:
             try:
-                result = await self.update_queue.get()
-                
-                pnl = result.pnl_pct
-                self.recent_pnl.append(pnl)
-                
-                logger.info(f"📝 학습 완료: PnL {pnl*100:.2f}% (최근 {len(self.recent_pnl)}회 평균: {sum(self.recent_pnl)/len(self.recent_pnl)*100:.2f}%)")
+                # 결과가 들어올 때까지 대기한 뒤, 그 사이 쌓인 결과를 한 번에 꺼내 처리
+                await self._update_event.wait()
+                self._update_event.clear()
+                batch = list(self.update_queue)
+                self.update_queue.clear()
+                if not batch:
+                    continue
+
+                for pnl in batch:
+                    self.recent_pnl.append(pnl)
                 
-                self.update_queue.task_done()
+                window_avg = (self.recent_pnl.profit_sum + self.recent_pnl.loss_sum) / len(self.recent_pnl)
+                logger.info("📝 학습 완료 (%d건): PnL %.2f%% (최근 %d회 평균: %.2f%%)",
+                            len(batch), pnl * 100, len(self.recent_pnl), window_avg * 100)
+
             except Exception as e:
-                logger.error(f"Learning loop error: {e}")
+                logger.error("Learning loop error: %s", e)
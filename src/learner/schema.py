@@ -2,6 +2,7 @@
 거래 데이터 모델 및 AI 전략 파라미터 스키마.
 자가 적응형(Self-Adaptive) 파라미터 튜닝 지원.
 """
+from dataclasses import dataclass
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from pydantic import BaseModel, Field, ConfigDict
@@ -16,6 +17,40 @@ class TradeParams(BaseModel):
     volume_multiplier: float = 1.5 # 거래량 급증 기준 (평소 대비 배수)
 
 
+@dataclass(frozen=True, slots=True)
+class ParamSet:
+    """학습기 내부용 전략 파라미터 (TradeParams와 같은 필드, 검증 없는 경량 객체).
+
+    기본값은 TradeParams에만 정의합니다. (기본값이 필요하면 ParamSet.from_model(TradeParams()))
+    """
+    k: float
+    rsi_buy_threshold: int
+    stop_loss_pct: float
+    take_profit_pct: float
+    volume_multiplier: float
+
+    @classmethod
+    def from_model(cls, params: TradeParams) -> "ParamSet":
+        """TradeParams에서 생성."""
+        return cls(
+            k=params.k,
+            rsi_buy_threshold=params.rsi_buy_threshold,
+            stop_loss_pct=params.stop_loss_pct,
+            take_profit_pct=params.take_profit_pct,
+            volume_multiplier=params.volume_multiplier,
+        )
+
+    def to_model(self) -> TradeParams:
+        """외부 반환용 TradeParams로 변환 (내부에서 만든 값이므로 검증 생략)."""
+        return TradeParams.model_construct(
+            k=self.k,
+            rsi_buy_threshold=self.rsi_buy_threshold,
+            stop_loss_pct=self.stop_loss_pct,
+            take_profit_pct=self.take_profit_pct,
+            volume_multiplier=self.volume_multiplier,
+        )
+
+
 class TradeEvent(BaseModel):
     """실시간 거래 감시 이벤트."""
     trace_id: str
@@ -2,23 +2,53 @@
 공통 유틸리티 및 로깅 설정 모듈.
 최신 파이썬 시간 규격 반영.
 """
+import asyncio
 import logging
 import os
 import sys
 from datetime import datetime, timezone
+from typing import Optional
 
-# 로깅 설정
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
-logging.basicConfig(
-    level=LOG_LEVEL,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-    stream=sys.stdout
-)
+_logging_configured = False
+
+def configure_logging(level: Optional[str] = None):
+    """루트 로거 설정 (실행 진입점에서 한 번 호출, 중복 호출은 무시).
+
+    level을 주지 않으면 LOG_LEVEL 환경 변수(.env 포함)를 사용합니다.
+    """
+    global _logging_configured
+    if _logging_configured:
+        return
+    logging.basicConfig(
+        level=(level or os.getenv("LOG_LEVEL", "INFO")).upper(),
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+        stream=sys.stdout
+    )
+    _logging_configured = True
 
 def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
+def env_flag(name: str, default: bool) -> bool:
+    """환경 변수의 "true"/"false" 값을 bool로 해석 (미설정 시 default).
+
+    .env는 모듈 import 이후에 로드되므로, 객체 생성 시점에 호출해야 합니다.
+    """
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.lower() == "true"
+
 def now_utc() -> datetime:
     """현재 UTC 시간 반환 (최신 방식)."""
     return datetime.now(timezone.utc)
+
+def install_uvloop() -> bool:
+    """uvloop이 설치되어 있으면 asyncio 기본 이벤트 루프로 사용 (윈도우는 미지원)."""
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
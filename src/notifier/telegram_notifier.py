@@ -4,35 +4,117 @@
 """
 import os
 import asyncio
+from datetime import timedelta
+from typing import List, Optional
 from telegram import Bot
+from telegram.error import NetworkError, RetryAfter
+from telegram.request import HTTPXRequest
 from src.learner.utils import get_logger
 
 logger = get_logger(__name__)
 
+# 봇 수명 동안 재사용하는 HTTP 커넥션 풀 설정
+HTTP_POOL_SIZE = 8
+HTTP_TIMEOUT_SECONDS = 5.0
+
+# 알림 묶음 전송 설정: 짧은 시간 안에 쌓인 메시지를 한 번의 요청으로 전송
+BATCH_WINDOW_SECONDS = 0.2
+MAX_MESSAGE_LENGTH = 4096  # 텔레그램 메시지 최대 길이
+MAX_SEND_RETRIES = 3
+FLUSH_TIMEOUT_SECONDS = 10.0
+
+
+def _pack_messages(messages: List[str], limit: int = MAX_MESSAGE_LENGTH) -> List[str]:
+    """메시지들을 구분선으로 이어 붙이되, 한 건이 limit를 넘지 않도록 나눔."""
+    packed = []
+    current = ""
+    for text in messages:
+        if current and len(current) + 2 + len(text) > limit:
+            packed.append(current)
+            current = text
+        else:
+            current = f"{current}\n\n{text}" if current else text
+    if current:
+        packed.append(current)
+    return packed
+
 
 class TelegramNotifier:
     """텔레그램 알림 및 명령어 수신 클래스."""
 
+    __slots__ = (
+        "token", "chat_id", "is_enabled", "last_update_id", "_chat_id_int",
+        "_outbox", "_sender", "_requests", "bot",
+    )
+
     def __init__(self):
         self.token = os.getenv("TELEGRAM_TOKEN")
         self.chat_id = os.getenv("TELEGRAM_CHAT_ID")
         self.is_enabled = bool(self.token and self.chat_id)
         self.last_update_id = 0
+        # 수신 메시지의 chat_id(int)와 바로 비교하도록 한 번만 변환 (숫자가 아니면 일치하는 대화방 없음)
+        try:
+            self._chat_id_int: Optional[int] = int(self.chat_id)
+        except (TypeError, ValueError):
+            self._chat_id_int = None
+        self._outbox: asyncio.Queue = asyncio.Queue()
+        self._sender: Optional[asyncio.Task] = None
         
         if self.is_enabled:
-            self.bot = Bot(token=self.token)
+            # 메시지 전송용/명령어 수신용 커넥션 풀을 한 번만 만들고 계속 재사용
+            self._requests = (
+                HTTPXRequest(
+                    connection_pool_size=HTTP_POOL_SIZE,
+                    connect_timeout=HTTP_TIMEOUT_SECONDS,
+                    read_timeout=HTTP_TIMEOUT_SECONDS,
+                ),
+                HTTPXRequest(connect_timeout=HTTP_TIMEOUT_SECONDS, read_timeout=HTTP_TIMEOUT_SECONDS),
+            )
+            self.bot = Bot(token=self.token, request=self._requests[0], get_updates_request=self._requests[1])
         else:
             logger.warning("텔레그램 설정이 누락되었습니다. (.env 확인 필요)")
 
     async def send_message(self, text: str):
-        """메시지 전송."""
+        """메시지 전송 예약 (백그라운드 전송 태스크가 모아서 전송하므로 호출자는 대기하지 않음)."""
         if not self.is_enabled:
             return
 
-        try:
-            await self.bot.send_message(chat_id=self.chat_id, text=text)
-        except Exception as e:
-            logger.error(f"텔레그램 메시지 전송 실패: {e}")
+        self._outbox.put_nowait(text)
+        if self._sender is None or self._sender.done():
+            self._sender = asyncio.create_task(self._sender_loop())
+
+    async def _sender_loop(self):
+        """대기열의 메시지를 짧은 간격으로 모아 묶음 단위로 전송."""
+        while True:
+            batch = [await self._outbox.get()]
+            await asyncio.sleep(BATCH_WINDOW_SECONDS)
+            while not self._outbox.empty():
+                batch.append(self._outbox.get_nowait())
+            try:
+                for text in _pack_messages(batch):
+                    await self._deliver(text)
+            finally:
+                for _ in batch:
+                    self._outbox.task_done()
+
+    async def _deliver(self, text: str):
+        """한 건 전송. 전송 제한/네트워크 오류는 대기 후 재시도."""
+        for attempt in range(MAX_SEND_RETRIES):
+            try:
+                await self.bot.send_message(chat_id=self.chat_id, text=text)
+                return
+            except RetryAfter as e:
+                delay = e.retry_after
+                delay = delay.total_seconds() if isinstance(delay, timedelta) else float(delay)
+                logger.warning("텔레그램 전송 제한, %.1f초 후 재시도", delay)
+            except NetworkError as e:
+                delay = 2 ** attempt
+                logger.warning("텔레그램 네트워크 오류, %d초 후 재시도: %s", delay, e)
+            except Exception as e:
+                logger.error("텔레그램 메시지 전송 실패: %s", e)
+                return
+            await asyncio.sleep(delay)
+        logger.error("텔레그램 메시지 전송 실패: 재시도 %d회 초과", MAX_SEND_RETRIES)
 
     async def get_recent_command(self) -> str:
         """사용자가 보낸 최근 명령어를 안전하게 읽어옴."""
@@ -40,8 +122,8 @@ class TelegramNotifier:
             return ""
 
         try:
-            # 1. 최신 업데이트 가져오기
-            updates = await self.bot.get_updates(offset=self.last_update_id + 1, timeout=1)
+            # 1. 최신 업데이트 가져오기 (메인 루프를 막지 않도록 대기 없이 즉시 반환)
+            updates = await self.bot.get_updates(offset=self.last_update_id + 1, timeout=0)
             
             for update in updates:
                 # 다음 번 호출을 위해 마지막 update_id 업데이트
@@ -49,15 +131,15 @@ class TelegramNotifier:
                 
                 # 2. 메시지 확인
                 if update.message and update.message.text:
-                    user_chat_id = str(update.message.chat_id)
+                    user_chat_id = update.message.chat_id
                     text = update.message.text.strip()
                     
                     # 보안: 설정된 CHAT_ID와 일치하는지 확인
-                    if user_chat_id == str(self.chat_id):
-                        logger.info(f"📥 텔레그램 명령어 수신: {text}")
+                    if user_chat_id == self._chat_id_int:
+                        logger.info("📥 텔레그램 명령어 수신: %s", text)
                         return text
                     else:
-                        logger.warning(f"⚠️ 알 수 없는 사용자({user_chat_id})의 접근 시도: {text}")
+                        logger.warning("⚠️ 알 수 없는 사용자(%s)의 접근 시도: %s", user_chat_id, text)
         except Exception as e:
             # 타임아웃 에러 등은 무시하되, 치명적 에러는 기록
             if "Conflict" in str(e):
@@ -65,3 +147,21 @@ class TelegramNotifier:
             return ""
         
         return ""
+
+    async def close(self):
+        """대기 중인 메시지를 전송한 뒤 전송 태스크와 HTTP 커넥션 풀 정리."""
+        if not self.is_enabled:
+            return
+
+        if self._sender is not None:
+            try:
+                await asyncio.wait_for(self._outbox.join(), timeout=FLUSH_TIMEOUT_SECONDS)
+            except asyncio.TimeoutError:
+                logger.warning("텔레그램 미전송 메시지 %d건을 버립니다.", self._outbox.qsize())
+            self._sender.cancel()
+            self._sender = None
+
+        try:
+            await asyncio.gather(*(request.shutdown() for request in self._requests))
+        except Exception as e:
+            logger.warning("텔레그램 연결 종료 중 오류: %s", e)
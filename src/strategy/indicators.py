@@ -0,0 +1,366 @@
+"""
+기술적 지표 계산 모듈 (NumPy 기반).
+전략은 마지막 봉의 지표 값만 사용하므로, 확정 봉을 롤링 윈도우 합계로 유지하고
+새 봉이 들어올 때만 증분 갱신합니다. (MinuteIndicators, TrendIndicators)
+기존 pandas 계산식(rolling/ewm)과 동일한 결과를 반환합니다.
+"""
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+# OHLCV 배열 열 인덱스: [timestamp(ms), open, high, low, close, volume]
+TS, OPEN, HIGH, LOW, CLOSE, VOLUME = range(6)
+
+MS_PER_DAY = 86_400_000
+
+
+def to_ohlcv_array(ohlcv) -> np.ndarray:
+    """행 리스트 또는 (N, 6) 배열을 float64 배열로 변환 (이미 float64 배열이면 복사 없음)."""
+    return np.asarray(ohlcv, dtype=np.float64)
+
+
+def _rsi(gain: float, loss: float) -> float:
+    """평균 상승폭/하락폭으로 RSI 계산."""
+    if loss == 0.0:
+        # pandas 계산식과 동일: 하락이 없으면 100, 변동이 전혀 없으면 NaN
+        return 100.0 if gain > 0.0 else float("nan")
+    return 100.0 - (100.0 / (1.0 + gain / loss))
+
+
+def ema_last(values: np.ndarray, span: int) -> float:
+    """마지막 시점의 지수 이동평균 (ewm(span=span, adjust=True).mean().iloc[-1])."""
+    decay = 1.0 - 2.0 / (span + 1.0)
+    weights = decay ** np.arange(len(values) - 1, -1, -1, dtype=np.float64)
+    return float(weights @ values / weights.sum())
+
+
+class RollingWindow:
+    """고정 크기 링 버퍼 + 누적 합계 (값 추가 시 O(1)로 합계 갱신).
+
+    값은 dtype으로 저장하고, 합계는 저장된 값 기준으로 float64로 누적합니다.
+    """
+
+    def __init__(self, size: int, dtype=np.float64):
+        self.size = size
+        self._buffer = np.zeros(size, dtype=dtype)
+        self._head = 0
+        self._count = 0
+        self._nonzero = 0  # 0이 아닌 값 개수 (모두 0이면 합계를 정확히 0으로 유지)
+        self._pushes_since_resync = 0
+        self.sum = 0.0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def nonzero_count(self) -> int:
+        """윈도우 안의 0이 아닌 값 개수."""
+        return self._nonzero
+
+    def values(self) -> np.ndarray:
+        """오래된 순으로 정렬된 윈도우 값 (복사본)."""
+        if self._count < self.size:
+            return self._buffer[:self._count].copy()
+        return np.roll(self._buffer, -self._head)
+
+    def reset(self, values: np.ndarray = None):
+        """윈도우를 비우고, 주어진 값(오래된 순)의 마지막 size개로 다시 채움."""
+        self._head = 0
+        self._count = 0
+        self._nonzero = 0
+        self._pushes_since_resync = 0
+        self.sum = 0.0
+        if values is not None and len(values):
+            tail = values[-self.size:]
+            self._count = len(tail)
+            self._buffer[:self._count] = tail
+            self._head = self._count % self.size
+            self._resync()
+
+    def push(self, value: float):
+        """값을 추가하고, 가득 찬 경우 가장 오래된 값을 밀어냄."""
+        if self._count == self.size:
+            old = float(self._buffer[self._head])
+            self.sum -= old
+            self._nonzero -= old != 0.0
+        else:
+            self._count += 1
+        self._buffer[self._head] = value
+        # 합계와 저장값이 어긋나지 않도록 dtype으로 반올림된 값을 더함
+        value = float(self._buffer[self._head])
+        self._head = (self._head + 1) % self.size
+        self.sum += value
+        self._nonzero += value != 0.0
+
+        # 가감 누적에 따른 부동소수점 오차 방지: 한 바퀴마다 합계 재계산 (분할상환 O(1))
+        # 값이 모두 0이 되면 잔여 오차 없이 0으로 맞춤 (거래량 0, 하락 없음 등의 판정에 사용)
+        self._pushes_since_resync += 1
+        if self._pushes_since_resync >= self.size:
+            self._resync()
+        elif self._nonzero == 0:
+            self.sum = 0.0
+
+    def _resync(self):
+        window = self._buffer[:self._count]
+        self.sum = float(window.sum(dtype=np.float64))
+        self._nonzero = int(np.count_nonzero(window))
+        self._pushes_since_resync = 0
+
+
+class DecayingWindow:
+    """고정 크기 윈도우의 지수 가중합 (최신 값 가중치 1, 한 칸 오래될 때마다 decay배).
+
+    값 추가 시 O(1)로 갱신: sum' = decay * sum + new - decay**size * evicted
+    """
+
+    def __init__(self, size: int, decay: float):
+        self.size = size
+        self.decay = decay
+        self._evict_weight = decay ** size
+        self._weights = decay ** np.arange(size - 1, -1, -1, dtype=np.float64)  # 오래된 순 가중치
+        self._buffer = np.zeros(size, dtype=np.float64)
+        self._head = 0
+        self._count = 0
+        self._pushes_since_resync = 0
+        self.sum = 0.0
+
+    def reset(self, values: np.ndarray):
+        """주어진 값(오래된 순)의 마지막 size개로 다시 채움."""
+        tail = values[-self.size:]
+        self._count = len(tail)
+        self._buffer[:self._count] = tail
+        self._head = self._count % self.size
+        self._pushes_since_resync = 0
+        self.sum = float(self._weights[self.size - self._count:] @ tail)
+
+    def push(self, value: float):
+        """값을 추가하고, 가득 찬 경우 가장 오래된 값을 밀어냄."""
+        evicted = 0.0
+        if self._count == self.size:
+            evicted = float(self._buffer[self._head])
+        else:
+            self._count += 1
+        self._buffer[self._head] = value
+        self._head = (self._head + 1) % self.size
+        self.sum = self.decay * self.sum + value - self._evict_weight * evicted
+
+        # 누적 오차 방지: 한 바퀴마다 가중합 재계산 (분할상환 O(1))
+        self._pushes_since_resync += 1
+        if self._pushes_since_resync >= self.size:
+            self.reset(np.roll(self._buffer[:self._count], -self._head if self._count == self.size else 0))
+
+
+class CandleIndicators(ABC):
+    """봉 배열을 받아 마지막 시점 지표를 증분 계산하는 상태 객체의 기반 클래스.
+
+    마지막 봉은 아직 진행 중인 봉으로 보고, 확정된 봉만 롤링 윈도우에 넣어 둡니다.
+    매 호출에서는 새로 확정된 봉만 반영하고, 진행 중인 봉은 결과 계산 시에만 더합니다.
+    (수집 공백, 확정 봉 수정, 조회 개수 변경이 감지되면 전체 구간으로 다시 채움)
+    """
+
+    def __init__(self, max_advance: int = 20):
+        self.max_advance = max_advance  # 한 번에 이어 붙일 최대 신규 확정 봉 수 (넘으면 다시 채움)
+        self._closed_count = 0    # 조회된 확정 봉 개수 (윈도우 크기 기준)
+        self._last_ts = None      # 마지막으로 반영한 확정 봉 시각
+        self._last_close = 0.0    # 마지막으로 반영한 확정 봉 종가
+        self._forming_row = None  # 마지막으로 계산에 사용한 진행 중인 봉
+
+    def update(self, ohlcv: np.ndarray):
+        """(N, 6) 봉 배열로 상태를 갱신하고 마지막 시점 지표를 계산.
+
+        확정 봉과 진행 중인 봉이 직전 호출과 같으면 결과도 같으므로 계산을 생략합니다.
+        """
+        row = ohlcv[-1].tolist()
+        if (row == self._forming_row and self._closed_count == len(ohlcv) - 1
+                and ohlcv[-2, TS] == self._last_ts and ohlcv[-2, CLOSE] == self._last_close):
+            return
+        self._forming_row = row
+
+        closed = ohlcv[:-1]
+        if not self._advance(closed):
+            self._seed(closed)
+            self._closed_count = len(closed)
+            self._last_ts = float(closed[-1, TS])
+            self._last_close = float(closed[-1, CLOSE])
+        self._compute(*row)
+
+    def _advance(self, closed: np.ndarray) -> bool:
+        """이전 상태에 이어지는 새 확정 봉만 반영. 이어지지 않으면 False."""
+        if self._last_ts is None or len(closed) != self._closed_count:
+            return False
+        ts = closed[:, TS]
+        idx = int(np.searchsorted(ts, self._last_ts))
+        if idx >= len(ts) or ts[idx] != self._last_ts or closed[idx, CLOSE] != self._last_close:
+            return False
+        new_rows = closed[idx + 1:]
+        if len(new_rows) >= self.max_advance:
+            return False
+        for row_ts, open_, high, low, close, volume in new_rows.tolist():
+            self._push(row_ts, open_, high, low, close, volume)
+            self._last_ts, self._last_close = row_ts, close
+        return True
+
+    @abstractmethod
+    def _seed(self, closed: np.ndarray):
+        """확정 봉 전체 구간으로 윈도우를 다시 채움."""
+        pass
+
+    @abstractmethod
+    def _push(self, ts: float, open_: float, high: float, low: float, close: float, volume: float):
+        """확정 봉 하나를 윈도우에 반영 (self._last_close는 아직 직전 봉 종가)."""
+        pass
+
+    @abstractmethod
+    def _compute(self, ts: float, open_: float, high: float, low: float, close: float, volume: float):
+        """진행 중인 봉을 더해 마지막 시점 지표 계산."""
+        pass
+
+
+class MinuteIndicators(CandleIndicators):
+    """1분봉 지표(RSI/이동평균/ATR/거래량 배수/당일 VWAP)의 증분 계산 상태."""
+
+    def __init__(self, rsi_period: int = 14, fast_period: int = 5, slow_period: int = 20,
+                 atr_period: int = 20, volume_lookback: int = 5):
+        super().__init__(max_advance=slow_period)
+        self.rsi_period = rsi_period
+        self.fast_period = fast_period
+        self.slow_period = slow_period
+        self.atr_period = atr_period
+        # 진행 중인 봉 1개를 더해 period를 채우므로 확정 봉 윈도우는 period - 1
+        self._gains = RollingWindow(rsi_period - 1)
+        self._losses = RollingWindow(rsi_period - 1)
+        self._fast = RollingWindow(fast_period - 1)
+        self._slow = RollingWindow(slow_period - 1)
+        self._true_ranges = RollingWindow(atr_period - 1)
+        self._volumes = RollingWindow(volume_lookback)  # 진행 중인 봉 직전 lookback개
+        # 당일 VWAP: 조회 구간 안의 당일 확정 봉 합계 (크기는 확정 봉 개수에 맞춰 생성)
+        self._vwap_tpv = None
+        self._vwap_vol = None
+        self._vwap_day = None
+        self.rsi = None
+        self.ma_fast = None
+        self.ma_slow = None
+        self.atr = None
+        self.volume_ratio = 1.0
+        self.vwap = None
+
+    def _compute(self, ts, open_, high, low, close, volume):
+        prev_close = self._last_close
+
+        delta = close - prev_close
+        self.rsi = _rsi((self._gains.sum + max(delta, 0.0)) / self.rsi_period,
+                        (self._losses.sum + max(-delta, 0.0)) / self.rsi_period)
+        self.ma_fast = (self._fast.sum + close) / self.fast_period
+        self.ma_slow = (self._slow.sum + close) / self.slow_period
+
+        true_range = max(high - low, abs(high - prev_close), abs(low - prev_close))
+        self.atr = (self._true_ranges.sum + true_range) / self.atr_period
+
+        avg_vol = self._volumes.sum / self._volumes.size
+        self.volume_ratio = volume / avg_vol if avg_vol > 0 else 1.0
+
+        tpv, vwap_vol = (high + low + close) / 3.0 * volume, volume
+        if int(ts) // MS_PER_DAY == self._vwap_day:
+            tpv += self._vwap_tpv.sum
+            vwap_vol += self._vwap_vol.sum
+        self.vwap = tpv / vwap_vol if vwap_vol != 0.0 else float("nan")
+
+    def _push(self, ts, open_, high, low, close, volume):
+        prev_close = self._last_close
+        delta = close - prev_close
+        self._gains.push(max(delta, 0.0))
+        self._losses.push(max(-delta, 0.0))
+        self._fast.push(close)
+        self._slow.push(close)
+        self._true_ranges.push(max(high - low, abs(high - prev_close), abs(low - prev_close)))
+        self._volumes.push(volume)
+
+        day = int(ts) // MS_PER_DAY
+        if day != self._vwap_day:
+            self._vwap_tpv.reset()
+            self._vwap_vol.reset()
+            self._vwap_day = day
+        self._vwap_tpv.push((high + low + close) / 3.0 * volume)
+        self._vwap_vol.push(volume)
+
+    def _seed(self, closed):
+        ts, high, low, close, volume = closed[:, TS], closed[:, HIGH], closed[:, LOW], closed[:, CLOSE], closed[:, VOLUME]
+        delta = np.diff(close[-self.rsi_period:])
+        self._gains.reset(np.maximum(delta, 0.0))
+        self._losses.reset(np.maximum(-delta, 0.0))
+        self._fast.reset(close)
+        self._slow.reset(close)
+
+        n = self.atr_period - 1
+        h, l, prev_close = high[-n:], low[-n:], close[-(n + 1):-1]
+        self._true_ranges.reset(np.maximum(h - l, np.maximum(np.abs(h - prev_close), np.abs(l - prev_close))))
+        self._volumes.reset(volume)
+
+        # 당일 VWAP 구간: 조회된 확정 봉 중 마지막 확정 봉과 같은 UTC 일자인 봉
+        if self._vwap_tpv is None or self._vwap_tpv.size != len(closed):
+            self._vwap_tpv = RollingWindow(len(closed))
+            self._vwap_vol = RollingWindow(len(closed))
+        day = ts // MS_PER_DAY
+        start = np.searchsorted(day, day[-1])
+        self._vwap_tpv.reset((high[start:] + low[start:] + close[start:]) / 3.0 * volume[start:])
+        self._vwap_vol.reset(volume[start:])
+        self._vwap_day = int(day[-1])
+
+
+class TrendIndicators(CandleIndicators):
+    """추세 판단용 봉(15분봉) RSI와 단기/장기 EMA의 증분 계산 상태.
+
+    EMA는 조회 구간 전체에 대한 adjust=True 가중 평균(ema_last)과 같은 값을 냅니다.
+    """
+
+    def __init__(self, rsi_period: int = 14, fast_span: int = 9, slow_span: int = 21):
+        super().__init__()
+        self.rsi_period = rsi_period
+        self.fast_span = fast_span
+        self.slow_span = slow_span
+        self._gains = RollingWindow(rsi_period - 1)
+        self._losses = RollingWindow(rsi_period - 1)
+        # EMA 가중합 윈도우와 정규화 값 (크기는 확정 봉 개수에 맞춰 생성)
+        # 가격은 기준가 대비 차이로 넣어, 횡보 구간에서 두 EMA가 정확히 같아지도록 함
+        self._anchor = 0.0
+        self._fast = None
+        self._slow = None
+        self._fast_norm = 1.0
+        self._slow_norm = 1.0
+        self.rsi = None
+        self.ema_fast = None
+        self.ema_slow = None
+
+    def _compute(self, ts, open_, high, low, close, volume):
+        delta = close - self._last_close
+        self.rsi = _rsi((self._gains.sum + max(delta, 0.0)) / self.rsi_period,
+                        (self._losses.sum + max(-delta, 0.0)) / self.rsi_period)
+        diff = close - self._anchor
+        self.ema_fast = self._anchor + (self._fast.decay * self._fast.sum + diff) / self._fast_norm
+        self.ema_slow = self._anchor + (self._slow.decay * self._slow.sum + diff) / self._slow_norm
+
+    def _push(self, ts, open_, high, low, close, volume):
+        delta = close - self._last_close
+        self._gains.push(max(delta, 0.0))
+        self._losses.push(max(-delta, 0.0))
+        self._fast.push(close - self._anchor)
+        self._slow.push(close - self._anchor)
+
+    def _seed(self, closed):
+        close = closed[:, CLOSE]
+        delta = np.diff(close[-self.rsi_period:])
+        self._gains.reset(np.maximum(delta, 0.0))
+        self._losses.reset(np.maximum(-delta, 0.0))
+
+        size = len(closed)
+        if self._fast is None or self._fast.size != size:
+            fast_decay = 1.0 - 2.0 / (self.fast_span + 1.0)
+            slow_decay = 1.0 - 2.0 / (self.slow_span + 1.0)
+            self._fast = DecayingWindow(size, fast_decay)
+            self._slow = DecayingWindow(size, slow_decay)
+            # 진행 중인 봉까지 포함한 size + 1개 가중치의 합
+            self._fast_norm = float((fast_decay ** np.arange(size + 1, dtype=np.float64)).sum())
+            self._slow_norm = float((slow_decay ** np.arange(size + 1, dtype=np.float64)).sum())
+        self._anchor = float(close[-1])
+        self._fast.reset(close - self._anchor)
+        self._slow.reset(close - self._anchor)
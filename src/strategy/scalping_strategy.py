@@ -2,11 +2,13 @@
 [울티메이트 하이브리드 전략 - 상태 메시지 로직 개선]
 데이터 수집 성공 여부를 명확히 표시하도록 수정되었습니다.
 """
-import pandas as pd
-import numpy as np
-from datetime import datetime, timezone
-from typing import Dict, Any, Optional, List
+import time
+from datetime import datetime
+from typing import Dict, Any, Optional, Sequence
 from .base_strategy import BaseStrategy
+from .indicators import (
+    MinuteIndicators, TrendIndicators, to_ohlcv_array,
+)
 from src.learner.utils import get_logger
 
 logger = get_logger(__name__)
@@ -29,6 +31,16 @@ class ScalpingStrategy(BaseStrategy):
         self.max_price = 0
         self.is_trailing = False
         self.entry_atr = 0
+        # 보유 시간 제한 시각 (epoch 초) - 진입 시각이 바뀔 때만 다시 계산
+        self._entry_time = None
+        self._exit_deadline = 0.0
+        # 청산 기준값 (왕복 수수료, 손절/익절 비율, 본전보존 발동가, 트레일링 콜백)
+        # 진입가/진입 ATR/수수료율이 바뀔 때만 다시 계산
+        self._exit_key = None
+        self._exit_levels = (0.0, 0.0, 0.0, 0.0, 0.0)
+        # 1분봉/15분봉 지표 증분 계산 상태
+        self._minute = MinuteIndicators(rsi_period=14, fast_period=5, slow_period=20, atr_period=20, volume_lookback=5)
+        self._trend = TrendIndicators(rsi_period=14, fast_span=9, slow_span=21)
         # 초기 상태 메시지
         self.last_reason = "🚀 시스템 기동 중... (데이터 수집 시작)"
 
@@ -37,47 +49,37 @@ class ScalpingStrategy(BaseStrategy):
         self.is_trailing = False
         self.entry_atr = 0
 
-    async def update_indicators(self, ohlcv_1m: List[List[Any]], ohlcv_15m: List[List[Any]] = None):
-        """데이터 수집 성공 시 상태 메시지를 먼저 업데이트합니다."""
-        if not ohlcv_1m or len(ohlcv_1m) < 30: 
-            self.last_reason = f"⏳ 1분봉 수집 중 ({len(ohlcv_1m) if ohlcv_1m else 0}/30)"
+    async def update_indicators(self, ohlcv_1m: Sequence[Sequence[Any]], ohlcv_15m: Sequence[Sequence[Any]] = None):
+        """데이터 수집 성공 시 상태 메시지를 먼저 업데이트합니다.
+
+        캔들은 행 리스트 또는 커넥터가 반환하는 (N, 6) NumPy 배열 모두 허용합니다.
+        """
+        count_1m = len(ohlcv_1m) if ohlcv_1m is not None else 0
+        if count_1m < 30:
+            self.last_reason = f"⏳ 1분봉 수집 중 ({count_1m}/30)"
             return
-            
-        if not ohlcv_15m or len(ohlcv_15m) < 20:
-            self.last_reason = f"⏳ 15분봉 수집 중 ({len(ohlcv_15m) if ohlcv_15m else 0}/20)"
+
+        count_15m = len(ohlcv_15m) if ohlcv_15m is not None else 0
+        if count_15m < 20:
+            self.last_reason = f"⏳ 15분봉 수집 중 ({count_15m}/20)"
             return
 
         # 데이터를 성공적으로 받았을 때의 기본 메시지
         self.last_reason = "👀 시장 분석 완료 (조건 대기 중)"
 
-        df = pd.DataFrame(ohlcv_1m, columns=['datetime', 'open', 'high', 'low', 'close', 'volume'])
-        df['date'] = pd.to_datetime(df['datetime'], unit='ms').dt.date
-        df['tp'] = (df['high'] + df['low'] + df['close']) / 3
-        df['cum_vol_price'] = df.groupby('date')['tp'].transform(lambda x: (x * df['volume']).cumsum())
-        df['cum_vol'] = df.groupby('date')['volume'].transform('cumsum')
-        self.vwap = (df['cum_vol_price'] / df['cum_vol']).iloc[-1]
-        
-        delta = df['close'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(14).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(14).mean()
-        self.rsi = (100 - (100 / (1 + (gain / loss)))).iloc[-1]
-        self.ma_5 = df['close'].rolling(5).mean().iloc[-1]
-        self.ma_20 = df['close'].rolling(20).mean().iloc[-1]
-        
-        df['tr'] = np.maximum(df['high'] - df['low'], np.maximum(abs(df['high'] - df['close'].shift(1)), abs(df['low'] - df['close'].shift(1))))
-        self.atr = df['tr'].rolling(20).mean().iloc[-1]
-        
-        avg_vol = df['volume'].iloc[-6:-1].mean()
-        self.volume_ratio = df['volume'].iloc[-1] / avg_vol if avg_vol > 0 else 1.0
-
-        df15 = pd.DataFrame(ohlcv_15m, columns=['datetime', 'open', 'high', 'low', 'close', 'volume'])
-        ema9_15 = df15['close'].ewm(span=9).mean().iloc[-1]
-        ema21_15 = df15['close'].ewm(span=21).mean().iloc[-1]
-        d15 = df15['close'].diff()
-        g15 = (d15.where(d15 > 0, 0)).rolling(14).mean()
-        l15 = (-d15.where(d15 < 0, 0)).rolling(14).mean()
-        self.rsi_15m = (100 - (100 / (1 + (g15 / l15)))).iloc[-1]
-        self.is_15m_uptrend = (ema9_15 > ema21_15) or (self.rsi_15m > 55)
+        minute = self._minute
+        minute.update(to_ohlcv_array(ohlcv_1m))
+        self.vwap = minute.vwap
+        self.rsi = minute.rsi
+        self.ma_5 = minute.ma_fast
+        self.ma_20 = minute.ma_slow
+        self.atr = minute.atr
+        self.volume_ratio = minute.volume_ratio
+
+        trend = self._trend
+        trend.update(to_ohlcv_array(ohlcv_15m))
+        self.rsi_15m = trend.rsi
+        self.is_15m_uptrend = (trend.ema_fast > trend.ema_slow) or (self.rsi_15m > 55)
 
     async def check_signal(self, current_data: Dict[str, Any]) -> bool:
         """주도주에 포함되었을 때 더 상세한 분석 사유를 제공합니다."""
@@ -108,24 +110,38 @@ class ScalpingStrategy(BaseStrategy):
 
     def check_exit_signal(self, entry_price: float, current_price: float, entry_time: datetime = None) -> Optional[str]:
         if entry_time:
-            now = datetime.now(timezone.utc)
-            if (now - entry_time).total_seconds() / 60.0 >= self.max_holding_minutes:
+            if entry_time is not self._entry_time:
+                self._entry_time = entry_time
+                self._exit_deadline = entry_time.timestamp() + self.max_holding_minutes * 60.0
+            if time.time() >= self._exit_deadline:
                 return "TL_시간제한"
-        raw_pnl = (current_price - entry_price) / entry_price
-        net_pnl = raw_pnl - (self.fee_rate * 2)
-        atr_val = self.entry_atr if self.entry_atr > 0 else (entry_price * 0.002)
-        dynamic_sl_pct = max(0.002, min(0.005, (atr_val / entry_price) * 1.5))
-        dynamic_tp_pct = max(0.003, min(0.008, (atr_val / entry_price) * 2.5))
+        if (entry_price, self.entry_atr, self.fee_rate) != self._exit_key:
+            self._update_exit_levels(entry_price)
+        round_trip_fee, dynamic_sl_pct, dynamic_tp_pct, breakeven_price, dynamic_callback = self._exit_levels
+        net_pnl = (current_price - entry_price) / entry_price - round_trip_fee
         if current_price > self.max_price: self.max_price = current_price
         if net_pnl <= -dynamic_sl_pct: return f"SL_가변손절({dynamic_sl_pct:.2%})"
-        if self.max_price >= entry_price * (1 + dynamic_tp_pct * 0.5):
+        if self.max_price >= breakeven_price:
             if net_pnl < 0.0005: return "BE_본전보존"
         if not self.is_trailing and net_pnl >= dynamic_tp_pct: self.is_trailing = True
         if self.is_trailing:
-            dynamic_callback = max(0.001, min(0.003, dynamic_tp_pct * 0.3))
             drop_from_max = (self.max_price - current_price) / self.max_price
             if drop_from_max >= dynamic_callback: return f"TS_가변익절({net_pnl:.2%})"
         return None
 
+    def _update_exit_levels(self, entry_price: float):
+        """포지션별 청산 기준값 계산 (틱마다 바뀌지 않는 값)."""
+        atr_val = self.entry_atr if self.entry_atr > 0 else (entry_price * 0.002)
+        dynamic_sl_pct = max(0.002, min(0.005, (atr_val / entry_price) * 1.5))
+        dynamic_tp_pct = max(0.003, min(0.008, (atr_val / entry_price) * 2.5))
+        self._exit_levels = (
+            self.fee_rate * 2,
+            dynamic_sl_pct,
+            dynamic_tp_pct,
+            entry_price * (1 + dynamic_tp_pct * 0.5),
+            max(0.001, min(0.003, dynamic_tp_pct * 0.3)),
+        )
+        self._exit_key = (entry_price, self.entry_atr, self.fee_rate)
+
     def calculate_amount(self, balance: float, price: float) -> float:
         return balance / price
@@ -4,11 +4,11 @@
 """
 import asyncio
 import os
-import pandas as pd
 from datetime import datetime, timedelta
-from typing import Dict, Any, List
-from src.connector.exchange_base import ExchangeConnector
+from typing import Dict, Any, List, Callable, Awaitable
+from src.connector.exchange_base import get_connector
 from src.strategy.scalping_strategy import ScalpingStrategy
+from src.strategy.indicators import CLOSE, VOLUME, ema_last
 from src.notifier.telegram_notifier import TelegramNotifier
 from src.learner.utils import get_logger, now_utc
 
@@ -19,7 +19,7 @@ class StrategyManager:
     """울티메이트 트레이딩 시스템 (보고서 보강)."""
 
     def __init__(self):
-        self.connector = ExchangeConnector()
+        self.connector = get_connector()
         self.notifier = TelegramNotifier()
         self.is_running = False
         self.is_paused = False
@@ -27,6 +27,7 @@ class StrategyManager:
         symbols_str = os.getenv("SYMBOL_LIST", default_symbols)
         self.symbols = [s.strip() for s in symbols_str.split(",")]
         self.max_positions = 3
+        self.scan_workers = 4  # 심볼 스캔 동시 처리 워커 수 (ccxt 레이트리밋이 실제 요청 간격 조절)
         self.hot_symbols = []
         self.daily_max_loss_pct = 0.02
         self.max_consecutive_losses = 5
@@ -45,45 +46,61 @@ class StrategyManager:
         self.last_heartbeat_time = None
         self.is_market_safe = True
 
+    async def _scan_symbols(self, handler: Callable[[str], Awaitable[None]]):
+        """심볼 큐를 워커 여러 개가 나눠 처리 (종목별 거래소 요청을 동시에 진행)."""
+        queue: asyncio.Queue = asyncio.Queue()
+        for symbol in self.symbols:
+            queue.put_nowait(symbol)
+
+        async def worker():
+            while not queue.empty():
+                await handler(queue.get_nowait())
+
+        await asyncio.gather(*(worker() for _ in range(min(self.scan_workers, len(self.symbols)))))
+
     async def _update_hottest_symbols(self):
         scores = []
-        for symbol in self.symbols:
+
+        async def score_symbol(symbol: str):
             try:
                 # 15분봉 거래소 요청
                 ohlcv = await self.connector.fetch_ohlcv(symbol, timeframe='15m', limit=5)
                 if len(ohlcv) < 5: 
                     # 데이터 부족 시 전략 상태에도 기록
                     self.coin_data[symbol]['strategies']['trend'].last_reason = "⏳ 주도주 분석용 15분봉 데이터 부족"
-                    continue
-                df = pd.DataFrame(ohlcv, columns=['t', 'o', 'h', 'l', 'c', 'v'])
-                change = (df['c'].iloc[-1] - df['c'].iloc[-4]) / df['c'].iloc[-4]
-                vol_avg = df['v'].mean()
+                    return
+                close = ohlcv[:, CLOSE]
+                change = (close[-1] - close[-4]) / close[-4]
+                vol_avg = float(ohlcv[:, VOLUME].mean())
                 score = (change * 100 * 0.7) + (vol_avg / 1000000 * 0.3)
                 self.coin_data[symbol]['score'] = score
                 scores.append((symbol, score))
             except Exception as e:
-                logger.error(f"주도주 분석 에러 ({symbol}): {e}")
-                continue
+                logger.error("주도주 분석 에러 (%s): %s", symbol, e)
+
+        await self._scan_symbols(score_symbol)
         scores.sort(key=lambda x: x[1], reverse=True)
         self.hot_symbols = [s[0] for s in scores[:5]]
 
+    async def _update_symbol_indicators(self, symbol: str):
+        try:
+            ohlcv_1m, ohlcv_15m = await asyncio.gather(
+                self.connector.fetch_ohlcv(symbol, timeframe='1m', limit=100),
+                self.connector.fetch_ohlcv(symbol, timeframe='15m', limit=50),
+            )
+
+            strategy = self.coin_data[symbol]['strategies']['trend']
+            # 데이터가 아예 안 오는지 체크
+            if len(ohlcv_1m) == 0:
+                strategy.last_reason = "❌ 거래소 응답 없음 (1분봉)"
+            elif len(ohlcv_15m) == 0:
+                strategy.last_reason = "❌ 거래소 응답 없음 (15분봉)"
+            else:
+                await strategy.update_indicators(ohlcv_1m, ohlcv_15m)
+        except Exception as e: logger.error("[%s] 지표 업데이트 실패: %s", symbol, e)
+
     async def _update_all_indicators(self):
-        for symbol in self.symbols:
-            try:
-                ohlcv_1m = await self.connector.fetch_ohlcv(symbol, timeframe='1m', limit=100)
-                ohlcv_15m = await self.connector.fetch_ohlcv(symbol, timeframe='15m', limit=50)
-                
-                strategy = self.coin_data[symbol]['strategies']['trend']
-                # 데이터가 아예 안 오는지 체크
-                if not ohlcv_1m:
-                    strategy.last_reason = "❌ 거래소 응답 없음 (1분봉)"
-                elif not ohlcv_15m:
-                    strategy.last_reason = "❌ 거래소 응답 없음 (15분봉)"
-                else:
-                    await strategy.update_indicators(ohlcv_1m, ohlcv_15m)
-                
-                await asyncio.sleep(0.1)
-            except Exception as e: logger.error(f"[{symbol}] 지표 업데이트 실패: {e}")
+        await self._scan_symbols(self._update_symbol_indicators)
         self.last_indicator_update = now_utc()
         await self._update_hottest_symbols()
 
@@ -113,7 +130,7 @@ class StrategyManager:
                 confidence = strategy.calculate_confidence()
                 entry_reason = strategy.last_reason
                 await self._execute_buy(symbol, ticker, "trend", confidence, entry_reason)
-        except Exception as e: logger.error(f"[{symbol}] 매수 탐색 오류: {e}")
+        except Exception as e: logger.error("[%s] 매수 탐색 오류: %s", symbol, e)
 
     # (이하 생략된 기존 메서드들은 유지됨)
     async def _init_daily_balance(self):
@@ -143,17 +160,21 @@ class StrategyManager:
     async def _check_market_sentiment(self):
         try:
             btc = await self.connector.fetch_ohlcv("BTC/KRW", timeframe='1m', limit=60)
-            df = pd.DataFrame(btc, columns=['t', 'o', 'h', 'l', 'c', 'v'])
-            ema10, ema30 = df['c'].ewm(span=10).mean().iloc[-1], df['c'].ewm(span=30).mean().iloc[-1]
-            self.is_market_safe = (df['c'].iloc[-1] > df['c'].iloc[-5] * 0.997) and (ema10 > ema30)
+            close = btc[:, CLOSE]
+            ema10, ema30 = ema_last(close, 10), ema_last(close, 30)
+            self.is_market_safe = bool(close[-1] > close[-5] * 0.997) and (ema10 > ema30)
         except: self.is_market_safe = True
 
     async def _monitor_positions_loop(self):
         while self.is_running:
-            for symbol in self.symbols:
+            held = [s for s in self.symbols
+                    if self.coin_data[s]['position'] and self.coin_data[s]['position'].get('state') != 'selling']
+            # 보유 종목 시세를 한 번의 요청으로 조회 (종목별 순차 조회 대기 제거)
+            tickers = await self.connector.fetch_tickers(held) if held else {}
+            for symbol in held:
                 pos = self.coin_data[symbol]['position']
                 if pos and pos.get('state') != 'selling':
-                    ticker = await self.connector.fetch_ticker(symbol)
+                    ticker = tickers.get(symbol)
                     if ticker:
                         exit_type = self.coin_data[symbol]['strategies'][pos['strategy_type']].check_exit_signal(
                             pos['entry_price'], ticker['last'], pos.get('entry_time')
@@ -180,7 +201,7 @@ class StrategyManager:
                 self.coin_data[symbol]['strategies'][pos['strategy_type']].reset_trailing_state()
                 self.coin_data[symbol]['last_sell_time'] = now_utc()
                 self.coin_data[symbol]['position'] = None
-        except Exception as e: logger.error(f"[{symbol}] 매도 실패: {e}")
+        except Exception as e: logger.error("[%s] 매도 실패: %s", symbol, e)
 
     async def _execute_buy(self, symbol: str, ticker: Dict[str, Any], strategy_type: str, confidence: float, entry_reason: str):
         try:
@@ -203,7 +224,7 @@ class StrategyManager:
                     'entry_reason': entry_reason
                 }
                 await self.notifier.send_message(f"🚀 [매수] {symbol}\n사유: {entry_reason}\n진입가: {ticker['last']:,.0f}")
-        except Exception as e: logger.error(f"[{symbol}] 매수 실패: {e}")
+        except Exception as e: logger.error("[%s] 매수 실패: %s", symbol, e)
 
     async def _process_commands(self):
         cmd = await self.notifier.get_recent_command()
@@ -216,6 +237,7 @@ class StrategyManager:
 
     async def start(self):
         self.is_running = True
+        await self.connector.load_markets()
         await self._init_daily_balance()
         await self.notifier.send_message("🌌 울티메이트 시스템 가동 (브리핑 로직 보강)")
         await self._update_all_indicators()
@@ -236,7 +258,7 @@ class StrategyManager:
                     await self._process_trading_logic(symbol, now)
                     await asyncio.sleep(0.2)
             except Exception as e:
-                logger.error(f"메인 루프 오류: {e}")
+                logger.error("메인 루프 오류: %s", e)
                 await asyncio.sleep(2)
             await asyncio.sleep(0.5)
 
@@ -270,6 +292,6 @@ class StrategyManager:
             
             msg += f"\n🔥 주도주 리스트: {', '.join([s.split('/')[0] for s in self.hot_symbols[:3]])}"
             await self.notifier.send_message(msg)
-        except Exception as e: logger.error(f"보고서 생성 실패: {e}")
+        except Exception as e: logger.error("보고서 생성 실패: %s", e)
 
     def stop(self): self.is_running = False
@@ -0,0 +1,102 @@
+"""
+거래소 커넥터 단위 테스트.
+실제 네트워크 호출 없이 ccxt 메서드를 Mock으로 대체.
+"""
+import pytest
+import pytest_asyncio
+import asyncio
+from src.connector.exchange_base import ExchangeConnector
+
+
+@pytest_asyncio.fixture
+async def connector(monkeypatch):
+    monkeypatch.setenv("EXCHANGE_ID", "upbit")
+    monkeypatch.setenv("DRY_RUN", "True")
+    conn = ExchangeConnector()
+    yield conn
+    await conn.close()
+
+
+@pytest.mark.asyncio
+async def test_fetch_ticker_coalesces_concurrent_calls(connector):
+    """동시에 들어온 같은 종목 시세 요청은 한 번만 거래소로 전달되어야 함."""
+    calls = []
+
+    async def fake_fetch_ticker(symbol):
+        calls.append(symbol)
+        await asyncio.sleep(0.01)
+        return {"symbol": symbol, "last": 100.0}
+
+    connector.exchange.fetch_ticker = fake_fetch_ticker
+
+    results = await asyncio.gather(*(connector.fetch_ticker("BTC/KRW") for _ in range(5)))
+    cached = await connector.fetch_ticker("BTC/KRW")
+
+    assert calls == ["BTC/KRW"]
+    assert all(r["last"] == 100.0 for r in results)
+    assert cached is results[0]
+
+
+@pytest.mark.asyncio
+async def test_failed_fetch_is_not_cached(connector):
+    """조회 실패(빈 결과)는 캐시하지 않고 다음 호출에서 재시도해야 함."""
+    calls = []
+
+    async def failing_fetch_ohlcv(symbol, timeframe=None, limit=None):
+        calls.append(symbol)
+        raise RuntimeError("network down")
+
+    connector.exchange.fetch_ohlcv = failing_fetch_ohlcv
+
+    assert len(await connector.fetch_ohlcv("BTC/KRW", timeframe="1m", limit=10)) == 0
+    assert len(await connector.fetch_ohlcv("BTC/KRW", timeframe="1m", limit=10)) == 0
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_ohlcv_returns_readonly_array(connector):
+    """캔들은 (N, 6) float 배열로 반환되며 공유 캐시 보호를 위해 읽기 전용이어야 함."""
+    rows = [[1700000000000 + i * 60000, 1.0, 2.0, 0.5, 1.5, 10.0] for i in range(3)]
+
+    async def fake_fetch_ohlcv(symbol, timeframe=None, limit=None):
+        return rows
+
+    connector.exchange.fetch_ohlcv = fake_fetch_ohlcv
+
+    ohlcv = await connector.fetch_ohlcv("BTC/KRW", timeframe="1m", limit=3)
+
+    assert ohlcv.shape == (3, 6)
+    assert ohlcv[-1, 4] == 1.5
+    assert not ohlcv.flags.writeable
+
+
+@pytest.mark.asyncio
+async def test_session_respects_ssl_verify_setting(connector):
+    """주입한 세션도 ccxt 설정과 같이 verify=False이면 인증서 검증을 하지 않아야 함."""
+    connector.exchange.verify = False
+
+    connector._ensure_session()
+
+    assert connector.exchange.ssl_context is False
+    assert connector.exchange.tcp_connector._ssl is False
+
+
+@pytest.mark.asyncio
+async def test_close_is_bounded_and_closes_every_client(connector, monkeypatch):
+    """한 클라이언트의 close()가 멈춰도 제한 시간 안에 끝나고 나머지 클라이언트는 닫혀야 함."""
+    monkeypatch.setattr("src.connector.exchange_base.CLOSE_TIMEOUT_SECONDS", 0.05)
+    closed = []
+
+    class HangingStream:
+        async def close(self):
+            await asyncio.sleep(10)
+
+    async def fake_close():
+        closed.append("rest")
+
+    connector._stream = HangingStream()
+    connector.exchange.close = fake_close
+
+    await asyncio.wait_for(connector.close(), timeout=1.0)
+
+    assert closed == ["rest"]
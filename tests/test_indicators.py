@@ -0,0 +1,140 @@
+"""
+지표 계산 모듈 단위 테스트.
+NumPy 구현이 기존 pandas 계산식과 같은 값을 내는지 검증.
+증분 계산 상태는 아래의 마지막 값 전체 재계산 함수(기준 구현)와 비교합니다.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+from src.strategy.indicators import MS_PER_DAY, ema_last, MinuteIndicators, TrendIndicators
+
+
+def make_ohlcv(n: int = 100, seed: int = 0, start_ms: int = 1_700_000_000_000, step_ms: int = 60_000):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 0.5, n))
+    open_ = close + rng.normal(0, 0.2, n)
+    high = np.maximum(open_, close) + rng.random(n)
+    low = np.minimum(open_, close) - rng.random(n)
+    volume = rng.random(n) * 100 + 1
+    ts = start_ms + np.arange(n) * step_ms
+    return np.column_stack([ts, open_, high, low, close, volume])
+
+
+# 기준 구현: 조회 구간 전체에서 마지막 시점 지표를 다시 계산
+def sma_last(values: np.ndarray, period: int) -> float:
+    """마지막 시점의 단순 이동평균 (rolling(period).mean().iloc[-1])."""
+    return float(values[-period:].mean())
+
+
+def rsi_last(close: np.ndarray, period: int = 14) -> float:
+    """마지막 시점의 RSI (상승/하락폭 단순 이동평균 방식)."""
+    delta = np.diff(close[-(period + 1):])
+    gain = float(np.maximum(delta, 0.0).mean())
+    loss = float(np.maximum(-delta, 0.0).mean())
+    if loss == 0.0:
+        return 100.0 if gain > 0.0 else float("nan")
+    return 100.0 - (100.0 / (1.0 + gain / loss))
+
+
+def atr_last(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 20) -> float:
+    """마지막 시점의 ATR (True Range 단순 이동평균)."""
+    h = high[-period:]
+    l = low[-period:]
+    prev_close = close[-(period + 1):-1]
+    tr = np.maximum(h - l, np.maximum(np.abs(h - prev_close), np.abs(l - prev_close)))
+    return float(tr.mean())
+
+
+def daily_vwap_last(ts: np.ndarray, high: np.ndarray, low: np.ndarray,
+                    close: np.ndarray, volume: np.ndarray) -> float:
+    """마지막 봉이 속한 UTC 일자의 누적 VWAP."""
+    day = ts // MS_PER_DAY
+    start = np.searchsorted(day, day[-1])  # 시간순 정렬된 캔들에서 당일 첫 봉 위치
+    tp = (high[start:] + low[start:] + close[start:]) / 3.0
+    vol = volume[start:]
+    vol_sum = float(vol.sum())
+    if vol_sum == 0.0:
+        return float("nan")
+    return float(tp @ vol) / vol_sum
+
+
+def volume_ratio_last(volume: np.ndarray, lookback: int = 5) -> float:
+    """직전 lookback개 봉 평균 대비 마지막 봉 거래량 배수."""
+    avg_vol = float(volume[-(lookback + 1):-1].mean())
+    return float(volume[-1]) / avg_vol if avg_vol > 0 else 1.0
+
+
+def test_moving_averages_match_pandas():
+    """SMA/EMA/RSI/ATR 마지막 값이 pandas rolling/ewm 결과와 일치해야 함 (기준 구현 검증 포함)."""
+    data = make_ohlcv()
+    df = pd.DataFrame(data, columns=['datetime', 'open', 'high', 'low', 'close', 'volume'])
+
+    delta = df['close'].diff()
+    gain = delta.where(delta > 0, 0).rolling(14).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(14).mean()
+    expected_rsi = (100 - (100 / (1 + (gain / loss)))).iloc[-1]
+    prev_close = df['close'].shift(1)
+    tr = np.maximum(df['high'] - df['low'], np.maximum(abs(df['high'] - prev_close), abs(df['low'] - prev_close)))
+
+    close = data[:, 4]
+    assert sma_last(close, 20) == pytest.approx(df['close'].rolling(20).mean().iloc[-1])
+    assert ema_last(close, 9) == pytest.approx(df['close'].ewm(span=9).mean().iloc[-1])
+    assert rsi_last(close, 14) == pytest.approx(expected_rsi)
+    assert atr_last(data[:, 2], data[:, 3], close, 20) == pytest.approx(tr.rolling(20).mean().iloc[-1])
+
+
+def test_daily_vwap_resets_at_utc_midnight():
+    """VWAP은 마지막 봉이 속한 UTC 일자의 봉만 누적해야 함."""
+    midnight = 1_700_006_400_000  # UTC 자정 (86400000의 배수)
+    data = make_ohlcv(n=60, start_ms=midnight - 30 * 60_000)
+    today = data[30:]
+    tp = (today[:, 2] + today[:, 3] + today[:, 4]) / 3
+
+    vwap = daily_vwap_last(data[:, 0], data[:, 2], data[:, 3], data[:, 4], data[:, 5])
+
+    assert vwap == pytest.approx((tp * today[:, 5]).sum() / today[:, 5].sum())
+
+
+def test_edge_cases():
+    """하락이 없는 RSI는 100, 직전 거래량이 없으면 거래량 배수는 1.0."""
+    data = make_ohlcv(n=30)
+    data[:, 4] = np.arange(30, dtype=np.float64)
+    data[:-1, 5] = 0.0
+    state = MinuteIndicators()
+    state.update(data)
+    assert state.rsi == 100.0
+    assert state.volume_ratio == 1.0
+
+
+def test_minute_indicators_stream_matches_full_recompute():
+    """봉이 하나씩/여러 개씩 추가되거나 누락돼도 증분 계산 결과가 전체 재계산과 같아야 함 (UTC 자정 경과, 거래량 0 구간 포함)."""
+    data = np.delete(make_ohlcv(n=400, seed=3), [150, 151, 152, 290], axis=0)
+    data[200:230, 5] = 0.0
+    state = MinuteIndicators(rsi_period=14, fast_period=5, slow_period=20, atr_period=20, volume_lookback=5)
+    for end in list(range(100, 240)) + [240, 240, 243, 300, 340, 341, 342, len(data)]:
+        window = data[end - 100:end]
+        state.update(window)
+        ts, high, low, close, volume = window[:, 0], window[:, 2], window[:, 3], window[:, 4], window[:, 5]
+        assert state.rsi == pytest.approx(rsi_last(close, 14))
+        assert state.ma_fast == pytest.approx(sma_last(close, 5))
+        assert state.ma_slow == pytest.approx(sma_last(close, 20))
+        assert state.atr == pytest.approx(atr_last(high, low, close, 20))
+        assert state.volume_ratio == pytest.approx(volume_ratio_last(volume, 5))
+        assert state.vwap == pytest.approx(daily_vwap_last(ts, high, low, close, volume))
+
+
+def test_trend_indicators_stream_matches_full_recompute():
+    """15분봉 RSI/EMA 증분 계산 결과가 전체 재계산과 같고, 횡보 구간에서는 두 EMA가 같아야 함."""
+    data = make_ohlcv(n=600, seed=5, step_ms=900_000)
+    state = TrendIndicators(rsi_period=14, fast_span=9, slow_span=21)
+    for end in list(range(50, 250)) + [250, 252, 300, 301, len(data)]:
+        window = data[end - 50:end]
+        state.update(window)
+        close = window[:, 4]
+        assert state.rsi == pytest.approx(rsi_last(close, 14))
+        assert state.ema_fast == pytest.approx(ema_last(close, 9))
+        assert state.ema_slow == pytest.approx(ema_last(close, 21))
+
+    data[:, 1:5] = 100.0
+    state.update(data[-50:])
+    assert state.ema_fast == state.ema_slow == 100.0
@@ -4,9 +4,11 @@ pytest 기반 Mock 테스트.
 """
 import pytest
 import asyncio
+import numpy as np
+from dataclasses import fields
 from datetime import datetime
 from src.learner.online_learner import OnlineLearner
-from src.learner.schema import TradeEvent, ExecutionResult
+from src.learner.schema import TradeEvent, ExecutionResult, ParamSet, TradeParams
 
 # Mock 환경변수 설정
 @pytest.fixture(autouse=True)
@@ -59,4 +61,32 @@ async def test_online_learner_feedback():
     await asyncio.sleep(0.1)
     
     # 큐가 비워졌는지 확인 (training loop가 처리했는지)
-    assert learner.update_queue.empty()
+    assert not learner.update_queue
+
+
+@pytest.mark.asyncio
+async def test_performance_totals_match_window():
+    """누적 합계 기반 통계가 최근 50회 윈도우 전체 재계산과 일치해야 함."""
+    learner = OnlineLearner()
+    pnls = [((i * 37) % 11 - 5) / 1000 for i in range(120)]
+
+    for pnl in pnls:
+        learner.recent_pnl.append(pnl)
+
+    window = pnls[-50:]
+    profits = [p for p in window if p > 0]
+    losses = [p for p in window if p <= 0]
+    assert len(learner.recent_pnl) == 50
+    # 윈도우는 float32로 저장됨
+    assert learner.recent_pnl.values().tolist() == np.array(window, dtype=np.float32).tolist()
+    assert learner.recent_pnl.profit_count == len(profits)
+    assert learner.recent_pnl.loss_count == len(losses)
+    assert learner.recent_pnl.profit_sum == pytest.approx(sum(profits))
+    assert learner.recent_pnl.loss_sum == pytest.approx(sum(losses))
+
+
+def test_param_set_mirrors_trade_params():
+    """ParamSet은 TradeParams와 같은 필드를 가지며, 기본값은 TradeParams에서 가져와야 함."""
+    assert [f.name for f in fields(ParamSet)] == list(TradeParams.model_fields)
+    defaults = ParamSet.from_model(TradeParams())
+    assert defaults.to_model() == TradeParams()